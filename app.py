@@ -5,10 +5,26 @@ from flask import Flask, request, render_template, make_response, jsonify
 
 from lib.aws import save_file_to_s3, BUCKET_NAME
 from lib.pdf import Document
+from lib.warmup import is_ready, start_warm_up
 
 app = Flask("PDF-coverter")
 app.config["AWS_ACCESS_KEY_ID"] = os.environ.get("AWS_ACCESS_KEY_ID", "")
 app.config["AWS_SECRET_ACCESS_KEY"] = os.environ.get("AWS_SECRET_ACCESS_KEY", "")
+app.config["WARM_UP"] = os.environ.get("WARM_UP", "") == "1"
+
+def should_warm_up():
+    """
+    Warm-up runs only in the serving process: under `python app.py`
+    the Werkzeug reloader imports this module in the parent process too
+    """
+    if not app.config["WARM_UP"]:
+        return False
+    if __name__ == "__main__" and os.environ.get("WERKZEUG_RUN_MAIN") != "true":
+        return False
+    return True
+
+if should_warm_up():
+    start_warm_up(s3=bool(app.config["AWS_ACCESS_KEY_ID"] and app.config["AWS_SECRET_ACCESS_KEY"]))
 
 @app.route('/ping')
 def ping():
@@ -17,6 +33,16 @@ def ping():
     """
     return 'pong'
 
+@app.route('/ready')
+def ready():
+    """
+    Route for load balancer readiness checks,
+    returns 503 until warm-up is complete
+    """
+    if not app.config["WARM_UP"] or is_ready():
+        return 'ready'
+    return make_response('warming up', 503)
+
 @app.route('/', methods=['POST'])
 def main():
     """
@@ -1,13 +1,41 @@
-import boto3
+import os
+import threading
 
 
 BUCKET_NAME = "pdf-with-watermark"
 
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+def get_s3_client():
+    """
+    Returns S3 client, boto3 is imported and the client is created
+    on the first call only. Low-level clients are thread-safe,
+    so one client is shared by all requests
+    """
+    global _s3_client
+    with _s3_client_lock:
+        if _s3_client is None:
+            import boto3
+            _s3_client = boto3.client('s3')
+    return _s3_client
+
+def _reset_s3_client():
+    """
+    Forked processes create their own client: the parent's connections
+    can't be shared and the lock may be held by a thread that doesn't exist
+    """
+    global _s3_client, _s3_client_lock
+    _s3_client = None
+    _s3_client_lock = threading.Lock()
+
+os.register_at_fork(after_in_child=_reset_s3_client)
+
 def save_file_to_s3(filename: str, access_key: str, secret_key: str):
     print("Uploading to S3...")
     if access_key and secret_key:
-        s3 = boto3.resource('s3')
-        s3.Bucket(BUCKET_NAME).upload_file(filename, filename)
+        client = get_s3_client()
+        client.upload_file(filename, BUCKET_NAME, filename)
         return True
     print("Can't find credentials")
     return False
@@ -1,12 +1,15 @@
 from datetime import datetime
+from functools import lru_cache
 from math import floor, ceil
 import os
 import subprocess
 from sys import platform
+from typing import TYPE_CHECKING
 
-from fpdf import FPDF
-from PIL import Image, ImageDraw, ImageFont, ImageOps
-from PyPDF2 import PdfMerger, PdfReader, PdfWriter, _page
+# fpdf, PIL and PyPDF2 are imported inside the methods that use them,
+# so importing this module (and the app) stays cheap
+if TYPE_CHECKING:
+    from PyPDF2 import _page
 
 
 A4_SIZE = (595, 842,)
@@ -18,12 +21,39 @@ PADDING = 20
 PDF_EXTENSIONS = {".pdf"}
 WATERMARK_COLOR = (128, 128, 128, 100)
 WATERMARK_PATH = "watermark.pdf"
+FONT_PATH = "Roboto-Bold.ttf"
 
 
 class UnprocessibleFileException(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def load_pil_font(size: int):
+    """
+    Returns PIL font of the given size, fonts are cached after the first load
+    """
+    from PIL import ImageFont
+    return ImageFont.truetype(FONT_PATH, size=size)
+
+
+def add_fpdf_font(pdf):
+    """
+    Adds watermark font to FPDF document. On the first call fpdf parses
+    the TTF file and caches the metrics next to it in a .pkl file
+    """
+    pdf.add_font("Roboto", "", FONT_PATH, uni=True)
+
+
+def get_libreoffice_cmd():
+    """
+    Returns LibreOffice executable for the current platform
+    """
+    if platform == "darwin":
+        return ["/Applications/LibreOffice.app/Contents/MacOS/soffice"]
+    return ["libreoffice"]
+
+
 class BaseFile:
 
     def __init__(self) -> None:
@@ -120,6 +150,8 @@ class Document(BaseFile):
         return self.filename
     
     def merge_pages(self, path):
+        from PyPDF2 import PdfMerger
+
         merger = PdfMerger()
         for pdf in self.pages:
             merger.append(pdf)
@@ -141,6 +173,8 @@ class Document(BaseFile):
         Convert image files to PDF, saves locally
         :param path: path to a file
         """
+        from fpdf import FPDF
+
         print("Converting {} to pdf".format(path))
         pdf = FPDF("P", 'mm', 'A4')
         pdf.add_page()
@@ -155,10 +189,7 @@ class Document(BaseFile):
         convert a doc or docx document to PDF
         :param path: path to a file
         """
-        if platform == "linux":
-            cmd = 'libreoffice --convert-to pdf'.split() + [path]
-        elif platform == "darwin":
-            cmd = '/Applications/LibreOffice.app/Contents/MacOS/soffice --convert-to pdf'.split() + [path]
+        cmd = get_libreoffice_cmd() + ['--convert-to', 'pdf', path]
         p = subprocess.run(cmd)
         if p.returncode:
             raise subprocess.SubprocessError(p.stderr)
@@ -178,6 +209,8 @@ class Document(BaseFile):
         Apply watermark to a file
         :param f str: file path
         """
+        from PyPDF2 import PdfReader, PdfWriter
+
         reader = PdfReader(f)
         writer = PdfWriter()
         for page in reader.pages:
@@ -194,11 +227,12 @@ class Document(BaseFile):
         # self.delete_file(f)
         return new_filename
     
-    def merge_as_stamp(self, page: _page.PageObject, watermark: str):
+    def merge_as_stamp(self, page: "_page.PageObject", watermark: str):
         """
         For not digital generated PDF such as images or scans
         We can't put watermark under it, so we put on top
         """
+        from PyPDF2 import PdfReader
 
         print("Stamping watermark over the page")
         watermark_reader = PdfReader(watermark)
@@ -214,6 +248,8 @@ class Document(BaseFile):
         """
         Add password
         """
+        from PyPDF2 import PdfReader, PdfWriter
+
         reader = PdfReader(path)
         writer = PdfWriter()
 
@@ -254,6 +290,7 @@ class Watermark(BaseFile):
         """
         Helper method to add watermark to an image
         """
+        from PIL import Image, ImageDraw, ImageOps
 
         image = Image.open(self.path).convert("RGBA")
         image = ImageOps.exif_transpose(image)
@@ -290,9 +327,10 @@ class Watermark(BaseFile):
         Helper method to create a new PDF document 
         and add text to it
         """
-        
+        from fpdf import FPDF
+
         pdf = FPDF('P', 'pt', (self.dimensions))
-        pdf.add_font("Roboto", "", "Roboto-Bold.ttf", uni=True)
+        add_fpdf_font(pdf)
 
         self._set_right_font_fpdf(self.dimensions[0], pdf)
         pdf.set_text_color(128, 128, 128)
@@ -318,11 +356,11 @@ class Watermark(BaseFile):
     
     def _get_right_font_pil(self, max_length):
         font_size = FONT_START_SIZE
-        font = ImageFont.truetype("Roboto-Bold.ttf", size=font_size)
+        font = load_pil_font(font_size)
         length = font.getlength(self.watermark)
         while length > max_length - PADDING:
             font_size -= PADDING
-            font = ImageFont.truetype("Roboto-Bold.ttf", size=font_size)
+            font = load_pil_font(font_size)
             length = font.getlength(self.watermark)
         return font
     
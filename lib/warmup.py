@@ -0,0 +1,117 @@
+import os
+import signal
+import subprocess
+import tempfile
+import threading
+
+from lib.aws import get_s3_client
+from lib.pdf import (
+    FONT_START_SIZE, PADDING, add_fpdf_font, get_libreoffice_cmd, load_pil_font,
+)
+
+
+LIBREOFFICE_TIMEOUT = 120
+WARM_UP_DOCUMENT = "warmup.txt"
+
+_ready = threading.Event()
+# Arguments of the last start_warm_up call, used to warm up forked processes
+_warm_up_kwargs = None
+
+
+def is_ready():
+    """
+    Returns True when warm-up is complete
+    """
+    return _ready.is_set()
+
+
+def _import_modules():
+    import PyPDF2  # noqa: F401
+
+
+def _load_fonts():
+    for size in range(FONT_START_SIZE, 0, -PADDING):
+        load_pil_font(size)
+
+
+def _load_fpdf_font():
+    """
+    Makes fpdf parse the TTF file and write its metrics cache,
+    the slowest part of the first PDF watermark
+    """
+    from fpdf import FPDF
+
+    add_fpdf_font(FPDF())
+
+
+def _convert_document():
+    """
+    Converts a small document with headless LibreOffice, so the first
+    Word request doesn't pay for profile creation and cold disk reads.
+    Every conversion still starts a new soffice process
+    """
+    with tempfile.TemporaryDirectory() as outdir:
+        path = os.path.join(outdir, WARM_UP_DOCUMENT)
+        with open(path, "w") as f:
+            f.write("warm-up")
+        cmd = get_libreoffice_cmd() + ["--headless", "--convert-to", "pdf", "--outdir", outdir, path]
+        # LibreOffice wrapper starts soffice.bin as a child, run it in its own
+        # session so the whole group can be killed on timeout
+        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True)
+        try:
+            _, stderr = p.communicate(timeout=LIBREOFFICE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            os.killpg(p.pid, signal.SIGKILL)
+            p.communicate()
+            raise
+        if p.returncode:
+            raise subprocess.SubprocessError(stderr)
+
+
+def warm_up(s3: bool = True, libreoffice: bool = True):
+    """
+    Pays the first request costs upfront:
+    imports heavy modules, loads fonts, creates S3 client
+    and converts a document with LibreOffice.
+    Warm-up only speeds up the first requests, so a failed step is logged
+    and the instance is marked ready anyway
+    :param s3 bool: create S3 client
+    :param libreoffice bool: run LibreOffice conversion
+    """
+    print("Warming up...")
+    steps = [_import_modules, _load_fonts, _load_fpdf_font]
+    if s3:
+        steps.append(get_s3_client)
+    if libreoffice:
+        steps.append(_convert_document)
+    for step in steps:
+        try:
+            step()
+        except Exception as e:
+            print(f"Warm-up step {step.__name__} failed: {e!r}")
+    _ready.set()
+    print("Warm-up is complete")
+
+
+def start_warm_up(**kwargs):
+    """
+    Runs warm-up in a background thread
+    """
+    global _warm_up_kwargs
+    _warm_up_kwargs = kwargs
+    thread = threading.Thread(target=warm_up, kwargs=kwargs, daemon=True)
+    thread.start()
+    return thread
+
+
+def _after_fork():
+    """
+    Pre-forking servers (gunicorn --preload) import the app once in the
+    master process, the warm-up thread doesn't survive the fork,
+    so an unfinished warm-up is started again in every worker
+    """
+    if _warm_up_kwargs is not None and not is_ready():
+        start_warm_up(**_warm_up_kwargs)
+
+
+os.register_at_fork(after_in_child=_after_fork)
@@ -1,6 +1,9 @@
 import json
 import os
 import shutil
+import signal
+import subprocess
+import sys
 from unittest import mock
 
 from PIL import ImageFont
@@ -10,8 +13,18 @@ from werkzeug.datastructures import FileStorage
 
 from app import app
 from lib.pdf import BaseFile, Document, Watermark, UnprocessibleFileException
+from lib import aws, warmup
 from lib.aws import save_file_to_s3
 
+# Import time of the app module without Flask, in microseconds.
+# Measured with `python -X importtime -c "import app"` on the pinned requirements:
+# app took ~200 ms with lazy imports and 270-395 ms on the eager baseline,
+# almost all of the lazy time being Flask itself. Eager boto3, PIL, PyPDF2
+# and fpdf add at least ~70 ms on top of Flask, the budget is well below that
+# and doesn't depend on how fast the machine imports Flask
+IMPORT_TIME_BUDGET = 40_000
+HEAVY_MODULES = ("boto3", "fpdf", "PIL", "PyPDF2")
+
 def test_ping():
     # Create a test client using the Flask application configured for testing
     response = app.test_client().get('/ping')
@@ -19,6 +32,98 @@ def test_ping():
     assert response.data.decode('utf-8') == 'pong'
 
 
+class TestStartup:
+
+    def import_app(self):
+        """
+        Imports app in a fresh interpreter with -X importtime,
+        returns import time of app without Flask and loaded heavy modules
+        """
+        code = f"import app, sys; print([m for m in {HEAVY_MODULES} if m in sys.modules])"
+        p = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True, text=True, check=True,
+        )
+        cumulative = {}
+        for line in p.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() in ("app", "flask"):
+                cumulative[parts[2].strip()] = int(parts[1])
+        return cumulative["app"] - cumulative["flask"], p.stdout.strip()
+
+    def teardown_method(self):
+        warmup._ready.clear()
+        aws._s3_client = None
+
+    def test_import_time_budget(self):
+        import_time, _ = self.import_app()
+        assert import_time < IMPORT_TIME_BUDGET
+
+    def test_heavy_modules_not_imported(self):
+        _, loaded = self.import_app()
+        assert loaded == "[]"
+
+    @mock.patch.dict(app.config, {"WARM_UP": False})
+    def test_ready_without_warm_up(self):
+        response = app.test_client().get('/ready')
+        assert response.status_code == 200
+
+    @mock.patch.dict(app.config, {"WARM_UP": True})
+    def test_ready_after_warm_up(self):
+        response = app.test_client().get('/ready')
+        assert response.status_code == 503
+        warmup.warm_up(s3=False, libreoffice=False)
+        response = app.test_client().get('/ready')
+        assert response.status_code == 200
+
+    def test_warm_up_s3(self):
+        boto3 = mock.MagicMock()
+        with mock.patch.dict(sys.modules, {"boto3": boto3}):
+            warmup.warm_up(s3=True, libreoffice=False)
+            assert aws.get_s3_client() is boto3.client.return_value
+        boto3.client.assert_called_once_with("s3")
+        assert warmup.is_ready()
+
+    def test_warm_up_failed_step(self):
+        def _load_fonts():
+            raise OSError("no font")
+
+        with mock.patch.object(warmup, "_load_fonts", _load_fonts):
+            warmup.warm_up(s3=False, libreoffice=False)
+        assert warmup.is_ready()
+
+    @mock.patch.object(warmup.subprocess, "Popen")
+    def test_warm_up_libreoffice(self, mock):
+        mock.return_value.communicate.return_value = (b"", b"")
+        mock.return_value.returncode = 0
+        warmup.warm_up(s3=False, libreoffice=True)
+        cmd = mock.call_args.args[0]
+        assert "--headless" in cmd and cmd[-1].endswith(warmup.WARM_UP_DOCUMENT)
+        assert mock.call_args.kwargs["start_new_session"]
+        mock.return_value.communicate.assert_called_once_with(timeout=warmup.LIBREOFFICE_TIMEOUT)
+
+    @mock.patch.object(warmup.os, "killpg")
+    @mock.patch.object(warmup.subprocess, "Popen")
+    def test_libreoffice_timeout(self, mock_popen, mock_killpg):
+        mock_popen.return_value.communicate.side_effect = [
+            subprocess.TimeoutExpired("libreoffice", warmup.LIBREOFFICE_TIMEOUT), (b"", b""),
+        ]
+        with pytest.raises(subprocess.TimeoutExpired):
+            warmup._convert_document()
+        mock_killpg.assert_called_once_with(mock_popen.return_value.pid, signal.SIGKILL)
+
+    @mock.patch.object(warmup, "add_fpdf_font")
+    def test_warm_up_fpdf_font(self, mock):
+        warmup.warm_up(s3=False, libreoffice=False)
+        mock.assert_called_once()
+
+    @mock.patch.object(warmup, "start_warm_up")
+    def test_after_fork(self, mock_start):
+        with mock.patch.object(warmup, "_warm_up_kwargs", {"s3": False}):
+            warmup._after_fork()
+        mock_start.assert_called_once_with(s3=False)
+
+
 class TestBaseFile:
 
     def setup_method(self):